@@ -17,6 +17,7 @@ Options:
 """
 
 import sys
+import gc
 import argparse
 import random
 from typing import Tuple, Optional
@@ -25,7 +26,7 @@ from typing import Tuple, Optional
 sys.path.insert(0, 'src')
 
 from game.game import Game
-from game.constants import AIDifficulty, SCREEN_WIDTH, SCREEN_HEIGHT
+from game.constants import AIDifficulty, Config, SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 
 
 def parse_resolution(resolution_str: str) -> Tuple[int, int]:
@@ -91,14 +92,13 @@ Examples:
     return parser.parse_args()
 
 
-def setup_resolution(args: argparse.Namespace) -> None:
-    """Set up screen resolution based on command line arguments."""
+def build_config(args: argparse.Namespace) -> Config:
+    """Build the display configuration from command line arguments."""
     if args.windowed:
-        global SCREEN_WIDTH, SCREEN_HEIGHT
-        # Import and modify constants
-        import game.constants as constants
-        constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT = args.windowed
-        print(f"Setting windowed resolution to {args.windowed[0]}x{args.windowed[1]}")
+        width, height = args.windowed
+        print(f"Setting windowed resolution to {width}x{height}")
+        return Config(width, height, FPS)
+    return Config(SCREEN_WIDTH, SCREEN_HEIGHT, FPS)
 
 
 def main() -> None:
@@ -113,7 +113,7 @@ def main() -> None:
             print(f"Using random seed: {args.seed}")
         
         # Setup resolution
-        setup_resolution(args)
+        config = build_config(args)
         
         # Convert AI difficulty string to enum
         ai_difficulty_map = {
@@ -134,7 +134,13 @@ def main() -> None:
             print(f"Launching in default windowed mode: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
         
         # Create and run the game
-        game = Game(fullscreen=args.fullscreen, ai_difficulty=ai_difficulty)
+        game = Game(config, fullscreen=args.fullscreen, ai_difficulty=ai_difficulty, seed=args.seed)
+        
+        # Move long-lived startup objects (game, fonts, sprites, menus) out of
+        # the collector's view so gameplay collections only scan new objects
+        gc.collect()
+        gc.freeze()
+        gc.set_threshold(50_000, 20, 20)
         game.run()
         
         print("Game ended normally.")
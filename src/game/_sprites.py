@@ -0,0 +1,68 @@
+"""
+Pre-rendered entity sprites for Pasta Savaşı.
+
+Each visual variant is drawn once at import time so entities can draw
+themselves with a single blit instead of several pygame.draw calls.
+Call convert_sprites() once a display mode is set so every sprite
+matches the display's pixel format.
+"""
+
+import pygame
+from typing import Dict, Tuple
+
+from .constants import BLACK, BLUE, ORANGE, PLAYER_SIZE, PROJECTILE_SIZE, RED, WHITE
+
+
+# Facing directions a character can have
+FACINGS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _build_character_surface(color: Tuple[int, int, int],
+                             facing: Tuple[int, int]) -> pygame.Surface:
+    """Draw a character body with its facing direction indicator."""
+    surface = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, color, rect)
+    pygame.draw.rect(surface, BLACK, rect, 2)
+
+    # Facing direction indicator
+    center_x, center_y = rect.center
+    indicator_size = 8
+    end = (center_x + facing[0] * indicator_size, center_y + facing[1] * indicator_size)
+    pygame.draw.line(surface, WHITE, (center_x, center_y), end, 3)
+    return surface
+
+
+def _build_projectile_surface(color: Tuple[int, int, int]) -> pygame.Surface:
+    """Draw a pastry projectile as a bordered circle."""
+    surface = pygame.Surface((PROJECTILE_SIZE, PROJECTILE_SIZE), pygame.SRCALPHA)
+    radius = PROJECTILE_SIZE // 2
+    center = (radius, radius)
+    pygame.draw.circle(surface, color, center, radius)
+    pygame.draw.circle(surface, BLACK, center, radius, 2)
+    return surface
+
+
+PLAYER_SURFS: Dict[Tuple[int, int], pygame.Surface] = {
+    facing: _build_character_surface(BLUE, facing) for facing in FACINGS
+}
+AI_SURFS: Dict[Tuple[int, int], pygame.Surface] = {
+    facing: _build_character_surface(RED, facing) for facing in FACINGS
+}
+
+PLAYER_PROJECTILE_SURF = _build_projectile_surface(ORANGE)
+AI_PROJECTILE_SURF = _build_projectile_surface(RED)
+
+
+def convert_sprites() -> None:
+    """
+    Convert every sprite to the display pixel format so blits take SDL's
+    fast path. Must run after pygame.display.set_mode() and before a
+    ProjectilePool is created, since the pool captures its sprites.
+    """
+    global PLAYER_PROJECTILE_SURF, AI_PROJECTILE_SURF
+    for surfs in (PLAYER_SURFS, AI_SURFS):
+        for facing, surface in surfs.items():
+            surfs[facing] = surface.convert_alpha()
+    PLAYER_PROJECTILE_SURF = PLAYER_PROJECTILE_SURF.convert_alpha()
+    AI_PROJECTILE_SURF = AI_PROJECTILE_SURF.convert_alpha()
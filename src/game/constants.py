@@ -2,14 +2,24 @@
 Game constants and configuration for Pasta Savaşı.
 """
 
-from enum import Enum
-from typing import Tuple
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import NamedTuple, Tuple
 
 # Screen settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable runtime display configuration, threaded into game objects."""
+    width: int = SCREEN_WIDTH
+    height: int = SCREEN_HEIGHT
+    fps: int = FPS
+
+
 # Colors (inspired by HTML mockup)
 BACKGROUND_COLOR = (92, 148, 110)  # #5C946E
 WHITE = (255, 255, 255)
@@ -20,12 +30,12 @@ BLUE = (74, 122, 140)  # #4A7A8C
 RED = (168, 74, 74)  # #A84A4A
 
 # Game states
-class GameState(Enum):
-    MENU = "menu"
-    SETTINGS = "settings"
-    PLAYING = "playing"
-    GAME_OVER = "game_over"
-    QUIT = "quit"
+class GameState(IntEnum):
+    MENU = 0
+    SETTINGS = 1
+    PLAYING = 2
+    GAME_OVER = 3
+    QUIT = 4
 
 # Player settings
 PLAYER_SPEED = 300  # pixels per second
@@ -33,34 +43,29 @@ PLAYER_SIZE = 40
 PLAYER_MAX_HEALTH = 100
 
 # AI settings
-class AIDifficulty(Enum):
-    EASY = "easy"
-    NORMAL = "normal"
-    HARD = "hard"
+class AIDifficulty(IntEnum):
+    EASY = 0
+    NORMAL = 1
+    HARD = 2
+
+class AISettings(NamedTuple):
+    speed: int
+    throw_cooldown: float
+    reaction_time: float
 
 AI_SETTINGS = {
-    AIDifficulty.EASY: {
-        "speed": 150,
-        "throw_cooldown": 2.0,
-        "reaction_time": 1.0
-    },
-    AIDifficulty.NORMAL: {
-        "speed": 200,
-        "throw_cooldown": 1.5,
-        "reaction_time": 0.7
-    },
-    AIDifficulty.HARD: {
-        "speed": 250,
-        "throw_cooldown": 1.0,
-        "reaction_time": 0.4
-    }
+    AIDifficulty.EASY: AISettings(speed=150, throw_cooldown=2.0, reaction_time=1.0),
+    AIDifficulty.NORMAL: AISettings(speed=200, throw_cooldown=1.5, reaction_time=0.7),
+    AIDifficulty.HARD: AISettings(speed=250, throw_cooldown=1.0, reaction_time=0.4),
 }
+AI_BEHAVIOR_INTERVAL = 3.0  # seconds between behavior changes
 
 # Projectile settings
 PROJECTILE_SPEED = 400
 PROJECTILE_SIZE = 15
 PROJECTILE_DAMAGE = 20
 PROJECTILE_LIFETIME = 3.0  # seconds
+PROJECTILE_POOL_CAPACITY = 256  # slots preallocated by ProjectilePool
 
 # UI settings
 BUTTON_PADDING = 12
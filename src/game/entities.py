@@ -1,25 +1,56 @@
 """
-Game entities for Pasta Savaşı: Player, AI, and Projectiles.
+Game entities for Pasta Savaşı: Player and AI characters.
+Projectiles live in the structure-of-arrays ProjectilePool.
 """
 
 import pygame
 import math
 import random
-from typing import List, Tuple, Optional
-from enum import Enum
+from typing import List, Tuple, Optional, TYPE_CHECKING
+from enum import IntEnum
 
-from .constants import *
+from .constants import (
+    AI_BEHAVIOR_INTERVAL, AI_SETTINGS, FRICTION, PLAYER_MAX_HEALTH, PLAYER_SIZE,
+    PLAYER_SPEED, WHITE, AIDifficulty, Config,
+)
+from ._sprites import PLAYER_SURFS, AI_SURFS
 
+if TYPE_CHECKING:
+    from .projectile_pool import ProjectilePool
 
-class EntityType(Enum):
-    PLAYER = "player"
-    AI = "ai"
-    PROJECTILE = "projectile"
+# Movement keys bound once so input polling avoids repeated module lookups
+K_LEFT, K_RIGHT, K_UP, K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+K_a, K_d, K_w, K_s = pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s
+
+# Movement bits packed from the keyboard state each frame (see Game.update)
+MOVE_RIGHT, MOVE_LEFT, MOVE_DOWN, MOVE_UP = 1, 2, 4, 8
+
+
+def _move_velocity(mask: int) -> Tuple[float, float]:
+    """Player velocity for a movement mask; opposite keys cancel, diagonals scaled by 1/sqrt(2)."""
+    dx = bool(mask & MOVE_RIGHT) - bool(mask & MOVE_LEFT)
+    dy = bool(mask & MOVE_DOWN) - bool(mask & MOVE_UP)
+    if dx and dy:
+        return dx * PLAYER_SPEED * math.sqrt(0.5), dy * PLAYER_SPEED * math.sqrt(0.5)
+    return dx * PLAYER_SPEED, dy * PLAYER_SPEED
+
+
+# Final player velocity for every movement mask
+_MOVE_TABLE = tuple(_move_velocity(mask) for mask in range(16))
+
+
+class EntityType(IntEnum):
+    PLAYER = 0
+    AI = 1
+    PROJECTILE = 2
 
 
 class Entity:
     """Base entity class."""
     
+    __slots__ = ('x', 'y', 'width', 'height', 'entity_type',
+                 'velocity_x', 'velocity_y', 'rect', 'half_width', 'half_height')
+    
     def __init__(self, x: float, y: float, width: int, height: int, entity_type: EntityType):
         self.x = x
         self.y = y
@@ -29,79 +60,41 @@ class Entity:
         self.velocity_x = 0.0
         self.velocity_y = 0.0
         self.rect = pygame.Rect(int(x), int(y), width, height)
+        # Half extents cached for center computations
+        self.half_width = width // 2
+        self.half_height = height // 2
         
     def update(self, dt: float) -> None:
         """Update entity position and rect."""
         self.x += self.velocity_x * dt
         self.y += self.velocity_y * dt
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+        self.rect.topleft = (int(self.x), int(self.y))
         
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the entity (to be overridden by subclasses)."""
         pygame.draw.rect(screen, WHITE, self.rect)
         
 
-class Projectile(Entity):
-    """Pastry projectile entity."""
-    
-    def __init__(self, x: float, y: float, direction_x: float, direction_y: float, owner_type: EntityType):
-        super().__init__(x, y, PROJECTILE_SIZE, PROJECTILE_SIZE, EntityType.PROJECTILE)
-        
-        # Normalize direction and apply speed
-        magnitude = math.sqrt(direction_x**2 + direction_y**2)
-        if magnitude > 0:
-            self.velocity_x = (direction_x / magnitude) * PROJECTILE_SPEED
-            self.velocity_y = (direction_y / magnitude) * PROJECTILE_SPEED
-        
-        self.owner_type = owner_type
-        self.lifetime = PROJECTILE_LIFETIME
-        self.damage = PROJECTILE_DAMAGE
-        
-    def update(self, dt: float) -> bool:
-        """Update projectile. Returns False if should be destroyed."""
-        super().update(dt)
-        self.lifetime -= dt
-        
-        # Check screen bounds
-        if (self.x < -self.width or self.x > SCREEN_WIDTH or
-            self.y < -self.height or self.y > SCREEN_HEIGHT or
-            self.lifetime <= 0):
-            return False
-            
-        return True
-        
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the projectile as a colored circle."""
-        center = (int(self.x + self.width // 2), int(self.y + self.height // 2))
-        radius = self.width // 2
-        
-        # Different colors based on owner
-        if self.owner_type == EntityType.PLAYER:
-            color = ORANGE  # Player projectiles are orange
-        else:
-            color = RED     # AI projectiles are red
-            
-        pygame.draw.circle(screen, color, center, radius)
-        pygame.draw.circle(screen, BLACK, center, radius, 2)
-
-
 class Character(Entity):
     """Base character class for Player and AI."""
     
-    def __init__(self, x: float, y: float, entity_type: EntityType):
+    __slots__ = ('health', 'facing_x', 'facing_y', 'throw_cooldown', 'speed', '_bounds')
+    
+    def __init__(self, x: float, y: float, entity_type: EntityType, config: Config = Config()):
         super().__init__(x, y, PLAYER_SIZE, PLAYER_SIZE, entity_type)
+        self._bounds = pygame.Rect(0, 0, config.width, config.height)  # Playfield clamp rect
         self.health = PLAYER_MAX_HEALTH
         self.facing_x = 1  # Direction facing (-1 for left, 1 for right)
         self.facing_y = 0
         self.throw_cooldown = 0.0
         self.speed = PLAYER_SPEED
         
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, _F: float = FRICTION) -> None:
         """Update character with friction."""
+        # FRICTION is bound as a default so the hot path reads a local
         # Apply friction
-        self.velocity_x *= FRICTION
-        self.velocity_y *= FRICTION
+        self.velocity_x *= _F
+        self.velocity_y *= _F
         
         # Update cooldown
         if self.throw_cooldown > 0:
@@ -109,11 +102,16 @@ class Character(Entity):
         
         super().update(dt)
         
-        # Keep within screen bounds
-        self.x = max(0, min(self.x, SCREEN_WIDTH - self.width))
-        self.y = max(0, min(self.y, SCREEN_HEIGHT - self.height))
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+        # Keep within screen bounds; only a clamped axis is written back so
+        # the other keeps its sub-pixel position (e.g. sliding along a wall)
+        rect, bounds = self.rect, self._bounds
+        if not bounds.contains(rect):
+            old_x, old_y = rect.topleft
+            rect.clamp_ip(bounds)
+            if rect.x != old_x:
+                self.x = rect.x
+            if rect.y != old_y:
+                self.y = rect.y
         
     def take_damage(self, damage: int) -> bool:
         """Take damage. Returns True if character died."""
@@ -124,14 +122,14 @@ class Character(Entity):
         """Check if character can throw a projectile."""
         return self.throw_cooldown <= 0
         
-    def throw_projectile(self, target_x: float, target_y: float) -> Optional[Projectile]:
-        """Throw a projectile toward target position."""
+    def throw_projectile(self, target_x: float, target_y: float, pool: "ProjectilePool") -> bool:
+        """Throw a projectile toward target position into pool. Returns True if thrown."""
         if not self.can_throw():
-            return None
+            return False
             
         # Calculate direction from character center to target
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = self.x + self.half_width
+        center_y = self.y + self.half_height
         
         direction_x = target_x - center_x
         direction_y = target_y - center_y
@@ -147,157 +145,128 @@ class Character(Entity):
         # Set cooldown
         self.throw_cooldown = 1.0  # 1 second cooldown
         
-        return Projectile(center_x, center_y, direction_x, direction_y, self.entity_type)
+        pool.spawn(center_x, center_y, direction_x, direction_y)
+        return True
 
 
 class Player(Character):
     """Human player character."""
     
-    def __init__(self, x: float, y: float):
-        super().__init__(x, y, EntityType.PLAYER)
-        
-    def handle_input(self, keys: dict, dt: float) -> None:
-        """Handle player input."""
-        # Movement
-        move_x = 0
-        move_y = 0
+    __slots__ = ()
+    
+    def __init__(self, x: float, y: float, config: Config = Config()):
+        super().__init__(x, y, EntityType.PLAYER, config)
         
-        if keys.get(pygame.K_LEFT) or keys.get(pygame.K_a):
-            move_x -= 1
-        if keys.get(pygame.K_RIGHT) or keys.get(pygame.K_d):
-            move_x += 1
-        if keys.get(pygame.K_UP) or keys.get(pygame.K_w):
-            move_y -= 1
-        if keys.get(pygame.K_DOWN) or keys.get(pygame.K_s):
-            move_y += 1
-            
-        # Normalize diagonal movement
-        if move_x != 0 and move_y != 0:
-            move_x *= 0.707  # 1/sqrt(2)
-            move_y *= 0.707
-            
-        self.velocity_x = move_x * self.speed
-        self.velocity_y = move_y * self.speed
+    def handle_input(self, move_mask: int, dt: float) -> None:
+        """Handle player input given a mask of MOVE_* bits."""
+        # Diagonal normalization is baked into the lookup table
+        self.velocity_x, self.velocity_y = _MOVE_TABLE[move_mask]
         
-    def throw_at_mouse(self, mouse_pos: Tuple[int, int]) -> Optional[Projectile]:
+    def throw_at_mouse(self, mouse_pos: Tuple[int, int], pool: "ProjectilePool") -> bool:
         """Throw projectile toward mouse position."""
-        return self.throw_projectile(float(mouse_pos[0]), float(mouse_pos[1]))
+        return self.throw_projectile(float(mouse_pos[0]), float(mouse_pos[1]), pool)
         
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the player character."""
-        # Draw player as a blue rectangle with direction indicator
-        pygame.draw.rect(screen, BLUE, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
-        
-        # Draw facing direction indicator
-        center_x = self.rect.centerx
-        center_y = self.rect.centery
-        indicator_size = 8
-        
-        if self.facing_x != 0:
-            end_x = center_x + self.facing_x * indicator_size
-            pygame.draw.line(screen, WHITE, (center_x, center_y), (end_x, center_y), 3)
-        if self.facing_y != 0:
-            end_y = center_y + self.facing_y * indicator_size
-            pygame.draw.line(screen, WHITE, (center_x, center_y), (center_x, end_y), 3)
+        # Blue rectangle with direction indicator, pre-rendered per facing
+        screen.blit(PLAYER_SURFS[(self.facing_x, self.facing_y)], self.rect)
 
 
 class AIOpponent(Character):
     """AI opponent character."""
     
-    def __init__(self, x: float, y: float, difficulty: AIDifficulty):
-        super().__init__(x, y, EntityType.AI)
+    __slots__ = ('difficulty', 'settings', 'throw_cooldown_max', 'reaction_time',
+                 'target_x', 'target_y', 'last_seen_player_x', 'last_seen_player_y',
+                 'next_reaction', 'next_behavior', 'current_behavior',
+                 '_behavior_cycle', '_behavior_idx')
+    
+    def __init__(self, x: float, y: float, difficulty: AIDifficulty, seed: Optional[int] = None,
+                 config: Config = Config()):
+        super().__init__(x, y, EntityType.AI, config)
         self.difficulty = difficulty
         self.settings = AI_SETTINGS[difficulty]
-        self.speed = self.settings["speed"]
-        self.throw_cooldown_max = self.settings["throw_cooldown"]
-        self.reaction_time = self.settings["reaction_time"]
+        self.speed, self.throw_cooldown_max, self.reaction_time = self.settings
         
         # AI state
         self.target_x = x
         self.target_y = y
         self.last_seen_player_x = 0
         self.last_seen_player_y = 0
-        self.reaction_timer = 0.0
-        self.behavior_timer = 0.0
+        # Absolute game times (seconds) at which the next reaction and
+        # behavior change fire; compared against the `now` clock
+        self.next_reaction = self.reaction_time
+        self.next_behavior = AI_BEHAVIOR_INTERVAL
         self.current_behavior = "chase"  # "chase", "strafe", "retreat"
         
-    def update_ai(self, player: Player, dt: float) -> Optional[Projectile]:
-        """Update AI behavior and potentially throw projectile."""
-        self.behavior_timer += dt
-        self.reaction_timer += dt
-        
+        # Behavior schedule drawn up front from a private RNG so a given
+        # seed always yields the same sequence of behavior changes
+        rng = random.Random(seed)
+        self._behavior_cycle = tuple(rng.choice(("chase", "strafe", "retreat")) for _ in range(256))
+        self._behavior_idx = 0
+        
+    def update_ai(self, player: Player, dt: float, now: float, pool: "ProjectilePool") -> bool:
+        """
+        Update AI behavior and potentially throw projectile into pool.
+        `now` is the elapsed game time in seconds.
+        """
         # Update last seen player position with reaction delay
-        if self.reaction_timer >= self.reaction_time:
-            self.last_seen_player_x = player.x + player.width // 2
-            self.last_seen_player_y = player.y + player.height // 2
-            self.reaction_timer = 0.0
+        if now >= self.next_reaction:
+            self.last_seen_player_x = player.x + player.half_width
+            self.last_seen_player_y = player.y + player.half_height
+            self.next_reaction = now + self.reaction_time
             
         # Change behavior periodically
-        if self.behavior_timer >= 3.0:  # Change behavior every 3 seconds
-            behaviors = ["chase", "strafe", "retreat"]
-            self.current_behavior = random.choice(behaviors)
-            self.behavior_timer = 0.0
+        if now >= self.next_behavior:
+            self.current_behavior = self._behavior_cycle[self._behavior_idx & 255]
+            self._behavior_idx += 1
+            self.next_behavior = now + AI_BEHAVIOR_INTERVAL
             
-        # Calculate distance to player
-        distance = math.sqrt(
-            (self.last_seen_player_x - (self.x + self.width // 2))**2 +
-            (self.last_seen_player_y - (self.y + self.height // 2))**2
-        )
-        
-        # Choose target based on behavior
-        if self.current_behavior == "chase":
+        # Vector to player; squared distance avoids a sqrt for range checks
+        dx = self.last_seen_player_x - (self.x + self.half_width)
+        dy = self.last_seen_player_y - (self.y + self.half_height)
+        dist_sq = dx * dx + dy * dy
+        
+        # Choose target based on behavior; only strafe/retreat need a sqrt
+        behavior = self.current_behavior
+        if behavior == "chase":
             self.target_x = self.last_seen_player_x
             self.target_y = self.last_seen_player_y
-        elif self.current_behavior == "strafe":
-            # Move perpendicular to player direction
-            angle = math.atan2(
-                self.last_seen_player_y - (self.y + self.height // 2),
-                self.last_seen_player_x - (self.x + self.width // 2)
-            )
-            strafe_angle = angle + math.pi / 2
-            self.target_x = self.x + math.cos(strafe_angle) * 100
-            self.target_y = self.y + math.sin(strafe_angle) * 100
-        else:  # retreat
-            # Move away from player
-            if distance > 0:
-                direction_x = (self.x + self.width // 2) - self.last_seen_player_x
-                direction_y = (self.y + self.height // 2) - self.last_seen_player_y
-                magnitude = math.sqrt(direction_x**2 + direction_y**2)
-                if magnitude > 0:
-                    self.target_x = self.x + (direction_x / magnitude) * 100
-                    self.target_y = self.y + (direction_y / magnitude) * 100
+        elif dist_sq > 0:
+            scale = 100 / math.sqrt(dist_sq)
+            if behavior == "strafe":
+                # Move perpendicular to player direction: (cos, sin)(θ + π/2) = (-dy, dx) / d
+                self.target_x = self.x - dy * scale
+                self.target_y = self.y + dx * scale
+            else:  # retreat
+                # Move away from player
+                self.target_x = self.x - dx * scale
+                self.target_y = self.y - dy * scale
         
         # Move toward target
         self._move_toward_target(dt)
         
-        # Try to throw projectile if player is in range and line of sight
-        projectile = None
-        if distance < 300 and self.can_throw():  # Within throwing range
-            if self._has_line_of_sight(player):
-                projectile = self.throw_projectile(self.last_seen_player_x, self.last_seen_player_y)
-                if projectile:
-                    self.throw_cooldown = self.throw_cooldown_max
-                    
-        return projectile
+        # Try to throw if player is in range (300 px); cheapest checks first
+        thrown = False
+        if dist_sq < 90000 and self.can_throw() and self._has_line_of_sight(player):
+            thrown = self.throw_projectile(self.last_seen_player_x, self.last_seen_player_y, pool)
+            if thrown:
+                self.throw_cooldown = self.throw_cooldown_max
+                
+        return thrown
     
     def _move_toward_target(self, dt: float) -> None:
         """Move AI toward current target."""
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        
-        direction_x = self.target_x - center_x
-        direction_y = self.target_y - center_y
+        direction_x = self.target_x - (self.x + self.half_width)
+        direction_y = self.target_y - (self.y + self.half_height)
         
-        distance = math.sqrt(direction_x**2 + direction_y**2)
+        dist_sq = direction_x * direction_x + direction_y * direction_y
         
-        if distance > 10:  # Don't move if very close to target
+        if dist_sq > 100:  # Don't move if very close to target (10 px)
             # Normalize and apply speed
-            direction_x /= distance
-            direction_y /= distance
+            scale = self.speed / math.sqrt(dist_sq)
             
-            self.velocity_x = direction_x * self.speed
-            self.velocity_y = direction_y * self.speed
+            self.velocity_x = direction_x * scale
+            self.velocity_y = direction_y * scale
         else:
             self.velocity_x = 0
             self.velocity_y = 0
@@ -309,18 +278,5 @@ class AIOpponent(Character):
         
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the AI character."""
-        # Draw AI as a red rectangle with direction indicator
-        pygame.draw.rect(screen, RED, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
-        
-        # Draw facing direction indicator
-        center_x = self.rect.centerx
-        center_y = self.rect.centery
-        indicator_size = 8
-        
-        if self.facing_x != 0:
-            end_x = center_x + self.facing_x * indicator_size
-            pygame.draw.line(screen, WHITE, (center_x, center_y), (end_x, center_y), 3)
-        if self.facing_y != 0:
-            end_y = center_y + self.facing_y * indicator_size
-            pygame.draw.line(screen, WHITE, (center_x, center_y), (center_x, end_y), 3)
\ No newline at end of file
+        # Red rectangle with direction indicator, pre-rendered per facing
+        screen.blit(AI_SURFS[(self.facing_x, self.facing_y)], self.rect)
\ No newline at end of file
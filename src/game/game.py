@@ -4,35 +4,65 @@ Main game loop and state management for Pasta Savaşı.
 
 import pygame
 import sys
-from typing import Optional, List
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
 
 from .constants import *
 from .ui import *
 from .entities import *
+from .projectile_pool import ProjectilePool
+from .entities_fast import warm_up as warm_up_kernels
+from ._sprites import convert_sprites
+
+
+# Event types the game reacts to; everything else is dropped each frame
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                  pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED]
+
+# Events after which a static menu screen must be fully redrawn
+REDRAW_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                 pygame.WINDOWEXPOSED)
+
+# States whose screen only changes in response to input
+MENU_STATES = (GameState.MENU, GameState.SETTINGS, GameState.GAME_OVER)
+
+# Event types never handled, blocked at the SDL layer so they are not queued
+BLOCKED_EVENTS = [pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+                  pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.ACTIVEEVENT,
+                  pygame.TEXTINPUT, pygame.TEXTEDITING, pygame.KEYUP, pygame.MOUSEWHEEL]
+
+PAUSE_TEXT = "DURAKLADI - ESC ile devam"
 
 
 class Game:
     """Main game class handling all game states and logic."""
     
-    def __init__(self, fullscreen: bool = False, ai_difficulty: AIDifficulty = AIDifficulty.NORMAL):
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(self, config: Optional[Config] = None, fullscreen: bool = False,
+                 ai_difficulty: AIDifficulty = AIDifficulty.NORMAL, seed: Optional[int] = None):
+        # Only the modules the game uses; pygame.init() would also open the
+        # audio device, which is deferred until volume is first applied
+        pygame.display.init()
+        pygame.font.init()
         
         # Set up display
+        self.config = config or Config()
         if fullscreen:
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
             # Update screen size for fullscreen
-            global SCREEN_WIDTH, SCREEN_HEIGHT
-            SCREEN_WIDTH, SCREEN_HEIGHT = self.screen.get_size()
+            width, height = self.screen.get_size()
+            self.config = replace(self.config, width=width, height=height)
         else:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.screen = pygame.display.set_mode((self.config.width, self.config.height))
             
         pygame.display.set_caption("6C Sınıfı - Pasta Savaşı")
+        convert_sprites()  # Needs the display mode; before the pool captures sprites
+        pygame.event.set_blocked(BLOCKED_EVENTS)
         
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = GameState.MENU
         self.ai_difficulty = ai_difficulty
+        self.seed = seed
         
         # Load fonts
         self.font_large = load_font(FONT_SIZE_LARGE)
@@ -45,103 +75,85 @@ class Game:
         # Initialize game objects
         self.player: Optional[Player] = None
         self.ai_opponent: Optional[AIOpponent] = None
-        self.projectiles: List[Projectile] = []
+        # Projectiles partitioned by owner: each side's pool only hits the other side
+        self.player_projectiles = ProjectilePool(EntityType.PLAYER, config=self.config)
+        self.ai_projectiles = ProjectilePool(EntityType.AI, config=self.config)
+        warm_up_kernels()  # Pay JIT/cache-load cost at startup, not mid-game
         self.player_health_bar: Optional[HealthBar] = None
         self.ai_health_bar: Optional[HealthBar] = None
         
-        # Initialize menus
+        # Initialize menus and the static overlays drawn over the arena
         self._init_menus()
+        self._rebuild_overlays()
+        
+        # Per-state dispatch; states without an entry draw nothing / have no menu
+        self._draw_dispatch = {
+            GameState.MENU: self._draw_main_menu,
+            GameState.SETTINGS: self._draw_settings_menu,
+            GameState.PLAYING: self._draw_game,
+            GameState.GAME_OVER: self._draw_game_over,
+        }
+        self._menu_dispatch = {
+            GameState.MENU: self.main_menu,
+            GameState.SETTINGS: self.settings_menu,
+            GameState.GAME_OVER: self.game_over_menu,
+        }
         
         # Game state
         self.winner: Optional[str] = None
         self.paused = False
-        
+        self.game_time = 0.0  # Seconds of unpaused play in the current match
+        
+        # Menu screens are only redrawn when something changed
+        self._dirty = True
+        self._drawn_state: Optional[GameState] = None
+        self._drawn_paused = False
+        self._game_rects: List[pygame.Rect] = []  # Changing areas of the last game frame
+        self._mouse_pos = pygame.mouse.get_pos()  # Refreshed each handle_events()
+        
+    def _btn_pos(self, slot: int) -> Tuple[int, int]:
+        """Top-left of the centered menu button in the given vertical slot."""
+        return self._center_x, self._start_y + slot * (self._btn_h + self._btn_spacing)
+    
+    def _build_menu(self, rows: List[Tuple[Tuple[int, int], str, Tuple[int, int, int],
+                                           pygame.font.Font, Callable]]) -> Menu:
+        """Create a menu with one button per (pos, text, color, font, callback) row."""
+        menu = Menu(self.font_medium)
+        for (x, y), text, color, font, callback in rows:
+            menu.add_button(PixelButton(x, y, self._btn_w, self._btn_h,
+                                        text, color, font, callback))
+        return menu
+    
     def _init_menus(self) -> None:
         """Initialize all menu systems."""
-        # Main menu
-        self.main_menu = Menu(self.font_medium)
-        
         # Calculate button positions (centered)
-        button_width = 200
-        button_height = 60
-        button_spacing = 20
-        start_y = SCREEN_HEIGHT // 2 + 100
-        center_x = SCREEN_WIDTH // 2 - button_width // 2
-        
-        # Main menu buttons
-        play_button = PixelButton(
-            center_x, start_y,
-            button_width, button_height,
-            "OYNA", ORANGE, self.font_medium,
-            self._start_game
-        )
-        
-        settings_button = PixelButton(
-            center_x, start_y + button_height + button_spacing,
-            button_width, button_height,
-            "AYARLAR", BLUE, self.font_medium,
-            self._show_settings
-        )
-        
-        quit_button = PixelButton(
-            center_x, start_y + 2 * (button_height + button_spacing),
-            button_width, button_height,
-            "ÇIKIŞ", RED, self.font_medium,
-            self._quit_game
-        )
-        
-        self.main_menu.add_button(play_button)
-        self.main_menu.add_button(settings_button)
-        self.main_menu.add_button(quit_button)
-        
-        # Settings menu
-        self.settings_menu = Menu(self.font_medium)
-        
-        # Settings buttons
-        difficulty_button = PixelButton(
-            center_x, start_y - 50,
-            button_width, button_height,
-            f"ZORLUK: {self.ai_difficulty.value.upper()}", ORANGE, self.font_small,
-            self._cycle_difficulty
-        )
-        
-        volume_button = PixelButton(
-            center_x, start_y + button_spacing,
-            button_width, button_height,
-            f"SES: {int(self.volume * 100)}%", BLUE, self.font_small,
-            self._cycle_volume
-        )
-        
-        back_button = PixelButton(
-            center_x, start_y + 2 * (button_height + button_spacing),
-            button_width, button_height,
-            "GERİ", RED, self.font_medium,
-            self._show_main_menu
-        )
-        
-        self.settings_menu.add_button(difficulty_button)
-        self.settings_menu.add_button(volume_button)
-        self.settings_menu.add_button(back_button)
+        self._btn_w = 200
+        self._btn_h = 60
+        self._btn_spacing = 20
+        self._start_y = self.config.height // 2 + 100
+        self._center_x = self.config.width // 2 - self._btn_w // 2
+        
+        # Main menu
+        self.main_menu = self._build_menu([
+            (self._btn_pos(0), "OYNA", ORANGE, self.font_medium, self._start_game),
+            (self._btn_pos(1), "AYARLAR", BLUE, self.font_medium, self._show_settings),
+            (self._btn_pos(2), "ÇIKIŞ", RED, self.font_medium, self._quit_game),
+        ])
+        
+        # Settings menu; the first two buttons sit off the regular slots
+        self.settings_menu = self._build_menu([
+            ((self._center_x, self._start_y - 50), f"ZORLUK: {self.ai_difficulty.name}",
+             ORANGE, self.font_small, self._cycle_difficulty),
+            ((self._center_x, self._start_y + self._btn_spacing), f"SES: {int(self.volume * 100)}%",
+             BLUE, self.font_small, self._cycle_volume),
+            (self._btn_pos(2), "GERİ", RED, self.font_medium, self._show_main_menu),
+        ])
         
         # Game over menu
-        self.game_over_menu = Menu(self.font_medium)
-        
-        restart_button = PixelButton(
-            center_x, start_y,
-            button_width, button_height,
-            "YENİDEN OYNA", ORANGE, self.font_medium,
-            self._restart_game
-        )
-        
-        menu_button = PixelButton(
-            center_x, start_y + button_height + button_spacing,
-            button_width, button_height,
-            "MENÜ", BLUE, self.font_medium,
-            self._show_main_menu
-        )
-        
-        self.game_over_menu.add_button(restart_button)
-        self.game_over_menu.add_button(menu_button)
+        self.game_over_menu = self._build_menu([
+            (self._btn_pos(0), "YENİDEN OYNA", ORANGE, self.font_medium, self._restart_game),
+            (self._btn_pos(1), "MENÜ", BLUE, self.font_medium, self._show_main_menu),
+        ])
     
     def _start_game(self) -> None:
         """Start a new game."""
@@ -149,13 +161,18 @@ class Game:
         self.paused = False
         
         # Initialize player and AI
-        self.player = Player(100, SCREEN_HEIGHT // 2)
-        self.ai_opponent = AIOpponent(SCREEN_WIDTH - 150, SCREEN_HEIGHT // 2, self.ai_difficulty)
-        self.projectiles = []
+        width, height = self.config.width, self.config.height
+        self.player = Player(100, height // 2, self.config)
+        # Per-entity seed: the AI is entity 1 (the player is entity 0)
+        ai_seed = self.seed + 1 if self.seed is not None else None
+        self.ai_opponent = AIOpponent(width - 150, height // 2, self.ai_difficulty, ai_seed, self.config)
+        self.player_projectiles.clear()
+        self.ai_projectiles.clear()
+        self.game_time = 0.0
         
         # Initialize health bars
         self.player_health_bar = HealthBar(20, 20, 200, 20, PLAYER_MAX_HEALTH)
-        self.ai_health_bar = HealthBar(SCREEN_WIDTH - 220, 20, 200, 20, PLAYER_MAX_HEALTH)
+        self.ai_health_bar = HealthBar(width - 220, 20, 200, 20, PLAYER_MAX_HEALTH)
         
         self.winner = None
     
@@ -178,7 +195,7 @@ class Game:
         self.ai_difficulty = difficulties[(current_index + 1) % len(difficulties)]
         
         # Update button text
-        self.settings_menu.buttons[0].text = f"ZORLUK: {self.ai_difficulty.value.upper()}"
+        self.settings_menu.buttons[0].text = f"ZORLUK: {self.ai_difficulty.name}"
         
     def _cycle_volume(self) -> None:
         """Cycle through volume levels."""
@@ -190,6 +207,11 @@ class Game:
         self.settings_menu.buttons[1].text = f"SES: {int(self.volume * 100)}%"
         
         # Apply volume (when we have sounds)
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                return  # No audio device; the setting is still kept
         pygame.mixer.music.set_volume(self.volume)
         
     def _restart_game(self) -> None:
@@ -198,108 +220,151 @@ class Game:
         
     def handle_events(self) -> None:
         """Handle all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Pump once, pull only handled types, then drop whatever is left
+        pygame.event.pump()
+        events = pygame.event.get(eventtype=HANDLED_EVENTS, pump=False)
+        pygame.event.clear(pump=False)
+        # Pointer position sampled once per frame for throwing and menus
+        self._mouse_pos = pygame.mouse.get_pos()
+        
+        menu_dispatch = self._menu_dispatch
+        for event in events:
+            event_type = event.type
+            # Re-read per event: menu callbacks may switch state mid-batch
+            state = self.state
+            if event_type in REDRAW_EVENTS:
+                self._dirty = True
+                
+            # Menus get the event first; one they consume needs no further handling
+            menu = menu_dispatch.get(state)
+            if menu is not None and menu.handle_event(event):
+                continue
+                
+            if event_type == pygame.QUIT:
                 self.running = False
                 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.PLAYING:
+            elif event_type == pygame.KEYDOWN:
+                key = event.key
+                if key == pygame.K_ESCAPE:
+                    if state == GameState.PLAYING:
                         self.paused = not self.paused
-                    elif self.state == GameState.SETTINGS:
+                    elif state == GameState.SETTINGS:
                         self._show_main_menu()
-                    elif self.state == GameState.GAME_OVER:
+                    elif state == GameState.GAME_OVER:
                         self._show_main_menu()
-                elif event.key == pygame.K_F11:
+                elif key == pygame.K_F11:
                     # Toggle fullscreen
                     pygame.display.toggle_fullscreen()
                     
                 # Handle space for throwing in game
-                elif event.key == pygame.K_SPACE and self.state == GameState.PLAYING and not self.paused:
-                    if self.player and self.player.can_throw():
-                        mouse_pos = pygame.mouse.get_pos()
-                        projectile = self.player.throw_at_mouse(mouse_pos)
-                        if projectile:
-                            self.projectiles.append(projectile)
-            
-            # Handle menu events
-            if self.state == GameState.MENU:
-                self.main_menu.handle_event(event)
-            elif self.state == GameState.SETTINGS:
-                self.settings_menu.handle_event(event)
-            elif self.state == GameState.GAME_OVER:
-                self.game_over_menu.handle_event(event)
+                elif key == pygame.K_SPACE and state == GameState.PLAYING and not self.paused:
+                    player = self.player
+                    if player and player.can_throw():
+                        player.throw_at_mouse(self._mouse_pos, self.player_projectiles)
     
     def update(self, dt: float) -> None:
         """Update game logic."""
         if self.state == GameState.PLAYING and not self.paused:
+            self.game_time += dt
+            # Hot attributes bound to locals once per frame
+            player, ai = self.player, self.ai_opponent
+            
             # Update player
-            if self.player:
+            if player:
                 keys = pygame.key.get_pressed()
-                self.player.handle_input(keys, dt)
-                self.player.update(dt)
+                move_mask = ((MOVE_RIGHT if keys[K_RIGHT] or keys[K_d] else 0) |
+                             (MOVE_LEFT if keys[K_LEFT] or keys[K_a] else 0) |
+                             (MOVE_DOWN if keys[K_DOWN] or keys[K_s] else 0) |
+                             (MOVE_UP if keys[K_UP] or keys[K_w] else 0))
+                player.handle_input(move_mask, dt)
+                player.update(dt)
                 
             # Update AI
-            if self.ai_opponent and self.player:
-                ai_projectile = self.ai_opponent.update_ai(self.player, dt)
-                if ai_projectile:
-                    self.projectiles.append(ai_projectile)
-                self.ai_opponent.update(dt)
+            if ai and player:
+                ai.update_ai(player, dt, self.game_time, self.ai_projectiles)
+                ai.update(dt)
                 
             # Update projectiles
-            self.projectiles = [p for p in self.projectiles if p.update(dt)]
+            self.player_projectiles.update(dt)
+            self.ai_projectiles.update(dt)
             
             # Check collisions
             self._check_collisions()
             
             # Update health bars
-            if self.player_health_bar and self.player:
-                self.player_health_bar.set_health(self.player.health)
-            if self.ai_health_bar and self.ai_opponent:
-                self.ai_health_bar.set_health(self.ai_opponent.health)
+            if self.player_health_bar and player:
+                self.player_health_bar.set_health(player.health)
+            if self.ai_health_bar and ai:
+                self.ai_health_bar.set_health(ai.health)
                 
             # Check win condition
-            if self.player and self.player.health <= 0:
+            if player and player.health <= 0:
                 self.winner = "AI KAZANDI!"
                 self.state = GameState.GAME_OVER
-            elif self.ai_opponent and self.ai_opponent.health <= 0:
+            elif ai and ai.health <= 0:
                 self.winner = "OYUNCU KAZANDI!"
                 self.state = GameState.GAME_OVER
     
     def _check_collisions(self) -> None:
         """Check collisions between projectiles and characters."""
-        for projectile in self.projectiles[:]:  # Copy list to allow modification
-            hit = False
-            
-            # Check collision with player
-            if (projectile.owner_type != EntityType.PLAYER and 
-                self.player and projectile.rect.colliderect(self.player.rect)):
-                self.player.take_damage(projectile.damage)
-                hit = True
-                
-            # Check collision with AI
-            elif (projectile.owner_type != EntityType.AI and 
-                  self.ai_opponent and projectile.rect.colliderect(self.ai_opponent.rect)):
-                self.ai_opponent.take_damage(projectile.damage)
-                hit = True
-                
-            if hit:
-                self.projectiles.remove(projectile)
+        # Each character is only tested against the opposing side's pool.
+        # No broad phase: with one target per pool, the compiled per-pool
+        # test is cheaper than any bounds or grid pre-check would be.
+        for character, projectiles in ((self.player, self.ai_projectiles),
+                                       (self.ai_opponent, self.player_projectiles)):
+            if not character:
+                continue
+            hits = projectiles.collide(character.rect)
+            if hits:
+                character.take_damage(hits * projectiles.damage)
+    
+    def _active_menu(self) -> Optional[Menu]:
+        """Return the menu shown in the current state, if any."""
+        return self._menu_dispatch.get(self.state)
     
     def draw(self) -> None:
         """Draw everything on screen."""
-        self.screen.fill(BACKGROUND_COLOR)
-        
-        if self.state == GameState.MENU:
-            self._draw_main_menu()
-        elif self.state == GameState.SETTINGS:
-            self._draw_settings_menu()
-        elif self.state == GameState.PLAYING:
+        # Static menu screens: skip the frame entirely when nothing changed,
+        # and upload only the changed button areas after a hover change.
+        # During play only entities and health bars change: erase last
+        # frame's areas instead of clearing, and upload old + new areas.
+        if self.state != self._drawn_state or self.paused != self._drawn_paused:
+            self._dirty = True
+        menu = self._active_menu()
+        partial_rects = None
+        incremental = False
+        if not self._dirty:
+            if menu is not None:
+                if not menu.dirty_rects:
+                    return
+                partial_rects = menu.dirty_rects
+            elif self.state == GameState.PLAYING:
+                if self.paused:
+                    return
+                incremental = True
+        
+        if incremental:
+            previous_rects = self._game_rects
+            for rect in previous_rects:
+                self.screen.fill(BACKGROUND_COLOR, rect)
             self._draw_game()
-        elif self.state == GameState.GAME_OVER:
-            self._draw_game_over()
+            partial_rects = previous_rects + self._game_rects
+        else:
+            self.screen.fill(BACKGROUND_COLOR)
+            draw_state = self._draw_dispatch.get(self.state)
+            if draw_state is not None:
+                draw_state()
+            
+        if partial_rects is not None:
+            pygame.display.update(partial_rects)
+        else:
+            pygame.display.flip()
             
-        pygame.display.flip()
+        if menu is not None:
+            menu.dirty_rects.clear()
+        self._dirty = False
+        self._drawn_state = self.state
+        self._drawn_paused = self.paused
     
     def _draw_main_menu(self) -> None:
         """Draw the main menu."""
@@ -308,71 +373,95 @@ class Game:
         subtitle_text = "Pasta Savaşı"
         
         # Draw title with shadow
-        title_pos = (SCREEN_WIDTH // 2 - self.font_large.size(title_text)[0] // 2, 150)
+        title_pos = (self.config.width // 2 - self.font_large.size(title_text)[0] // 2, 150)
         draw_text_with_shadow(self.screen, title_text, self.font_large, title_pos, WHITE, BLACK, (4, 4))
         
         # Draw subtitle with shadow
-        subtitle_pos = (SCREEN_WIDTH // 2 - self.font_medium.size(subtitle_text)[0] // 2, 220)
+        subtitle_pos = (self.config.width // 2 - self.font_medium.size(subtitle_text)[0] // 2, 220)
         draw_text_with_shadow(self.screen, subtitle_text, self.font_medium, subtitle_pos, GOLD, BLACK, (3, 3))
         
         # Draw menu buttons
-        self.main_menu.draw(self.screen)
+        self.main_menu.draw(self.screen, self._mouse_pos)
         
         # Version info
-        version_text = "v1.0.0"
-        version_pos = (SCREEN_WIDTH - 80, SCREEN_HEIGHT - 30)
-        version_surface = self.font_small.render(version_text, False, (255, 255, 255, 128))
-        self.screen.blit(version_surface, version_pos)
+        self.screen.blit(self._version_surf, self._version_pos)
     
     def _draw_settings_menu(self) -> None:
         """Draw the settings menu."""
         # Title
         title_text = "AYARLAR"
-        title_pos = (SCREEN_WIDTH // 2 - self.font_large.size(title_text)[0] // 2, 150)
+        title_pos = (self.config.width // 2 - self.font_large.size(title_text)[0] // 2, 150)
         draw_text_with_shadow(self.screen, title_text, self.font_large, title_pos, WHITE, BLACK, (4, 4))
         
         # Draw settings buttons
-        self.settings_menu.draw(self.screen)
+        self.settings_menu.draw(self.screen, self._mouse_pos)
     
     def _draw_game(self) -> None:
         """Draw the game state."""
+        screen = self.screen
+        # Areas that change between frames, erased and uploaded by the next
+        # incremental draw; rects are copied since the originals keep moving
+        game_rects: List[pygame.Rect] = []
+        
         # Draw entities
         if self.player:
-            self.player.draw(self.screen)
+            self.player.draw(screen)
+            game_rects.append(self.player.rect.copy())
         if self.ai_opponent:
-            self.ai_opponent.draw(self.screen)
+            self.ai_opponent.draw(screen)
+            game_rects.append(self.ai_opponent.rect.copy())
             
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
+        for projectiles in (self.player_projectiles, self.ai_projectiles):
+            projectiles.draw(screen)
+            projectile_bounds = projectiles.bounds()
+            if projectile_bounds is not None:
+                game_rects.append(projectile_bounds.copy())
             
         # Draw UI
         if self.player_health_bar:
-            self.player_health_bar.draw(self.screen)
+            self.player_health_bar.draw(screen)
+            game_rects.append(self.player_health_bar.rect)
         if self.ai_health_bar:
-            self.ai_health_bar.draw(self.screen)
+            self.ai_health_bar.draw(screen)
+            game_rects.append(self.ai_health_bar.rect)
+        self._game_rects = game_rects
             
         # Draw health labels
         player_label = "OYUNCU"
         ai_label = "RAKIP"
         label_pos_player = (20, 50)
-        label_pos_ai = (SCREEN_WIDTH - 220, 50)
+        label_pos_ai = (self.config.width - 220, 50)
         
-        self.screen.blit(self.font_small.render(player_label, False, WHITE), label_pos_player)
-        self.screen.blit(self.font_small.render(ai_label, False, WHITE), label_pos_ai)
+        screen.blit(render_text_cached(self.font_small, player_label, WHITE), label_pos_player)
+        screen.blit(render_text_cached(self.font_small, ai_label, WHITE), label_pos_ai)
         
         # Draw pause overlay if paused
         if self.paused:
-            pause_text = "DURAKLADI - ESC ile devam"
-            pause_size = self.font_medium.size(pause_text)
-            pause_pos = ((SCREEN_WIDTH - pause_size[0]) // 2, (SCREEN_HEIGHT - pause_size[1]) // 2)
-            
-            # Semi-transparent background
-            pause_bg = pygame.Surface((pause_size[0] + 40, pause_size[1] + 20))
-            pause_bg.fill(BLACK)
-            pause_bg.set_alpha(180)
-            self.screen.blit(pause_bg, (pause_pos[0] - 20, pause_pos[1] - 10))
-            
-            draw_text_with_shadow(self.screen, pause_text, self.font_medium, pause_pos, WHITE, BLACK)
+            pause_x, pause_y = self._pause_pos
+            screen.blit(self._pause_bg, (pause_x - 20, pause_y - 10))
+            draw_text_with_shadow(screen, PAUSE_TEXT, self.font_medium, self._pause_pos, WHITE, BLACK)
+    
+    def _rebuild_overlays(self) -> None:
+        """Build the static overlays and labels; call again if the screen size changes."""
+        width, height = self.config.width, self.config.height
+        
+        # Half-transparent version label; Font.render ignores a color's alpha,
+        # so transparency is applied to the surface instead
+        self._version_surf = self.font_small.render("v1.0.0", False, WHITE).convert()
+        self._version_surf.set_alpha(128)
+        self._version_pos = (width - 80, height - 30)
+        
+        # Full-screen dimming behind the game over menu
+        self._gameover_overlay = pygame.Surface((width, height)).convert()
+        self._gameover_overlay.fill(BLACK)
+        self._gameover_overlay.set_alpha(128)
+        
+        # Semi-transparent box behind the centered pause text
+        pause_width, pause_height = self.font_medium.size(PAUSE_TEXT)
+        self._pause_pos = ((width - pause_width) // 2, (height - pause_height) // 2)
+        self._pause_bg = pygame.Surface((pause_width + 40, pause_height + 20)).convert()
+        self._pause_bg.fill(BLACK)
+        self._pause_bg.set_alpha(180)
     
     def _draw_game_over(self) -> None:
         """Draw the game over screen."""
@@ -380,29 +469,27 @@ class Game:
         self._draw_game()
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._gameover_overlay, (0, 0))
         
         # Winner announcement
         if self.winner:
             winner_size = self.font_large.size(self.winner)
-            winner_pos = ((SCREEN_WIDTH - winner_size[0]) // 2, 200)
+            winner_pos = ((self.config.width - winner_size[0]) // 2, 200)
             draw_text_with_shadow(self.screen, self.winner, self.font_large, winner_pos, GOLD, BLACK, (4, 4))
         
         # Draw game over menu
-        self.game_over_menu.draw(self.screen)
+        self.game_over_menu.draw(self.screen, self._mouse_pos)
     
     def run(self) -> None:
         """Main game loop."""
         while self.running and self.state != GameState.QUIT:
-            dt = self.clock.tick(FPS) / 1000.0  # Convert to seconds
+            dt = self.clock.tick(self.config.fps) / 1000.0  # Convert to seconds
             
             self.handle_events()
             self.update(dt)
             self.draw()
             
         # Clean shutdown
-        pygame.mixer.quit()
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
         pygame.quit()
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Structure-of-Arrays storage for pastry projectiles in Pasta Savaşı.
+"""
+
+import numpy as np
+import pygame
+from math import hypot
+from typing import Optional
+
+from .constants import (
+    PROJECTILE_DAMAGE, PROJECTILE_LIFETIME, PROJECTILE_POOL_CAPACITY, PROJECTILE_SIZE,
+    PROJECTILE_SPEED, Config,
+)
+from .entities import EntityType
+from . import _sprites
+from .entities_fast import collide_projectiles, step_projectiles
+
+
+class ProjectilePool:
+    """
+    Fixed-layout projectile storage backed by NumPy arrays.
+
+    Each pool holds the projectiles of one owner, so collision passes test
+    only the opposing side's pool and need no owner checks.
+
+    Live projectiles occupy the first `active_count` slots of every column;
+    updates run as vectorized array operations and dead projectiles are
+    compacted out with a boolean mask. Spawning writes into preallocated
+    slots, so throwing never allocates Python objects; the columns only
+    grow (by doubling) if more than `capacity` projectiles are alive.
+    """
+
+    def __init__(self, owner_type: EntityType, capacity: int = PROJECTILE_POOL_CAPACITY,
+                 config: Config = Config()):
+        self.owner_type = owner_type
+        self.capacity = capacity
+        self._sw = config.width
+        self._sh = config.height
+        self.active_count = 0
+        self.width = PROJECTILE_SIZE
+        self.height = PROJECTILE_SIZE
+        self.radius = PROJECTILE_SIZE // 2
+        self._bounds_rect = pygame.Rect(0, 0, 0, 0)
+        self.damage = PROJECTILE_DAMAGE
+        # Player projectiles are orange, AI ones red. Read at construction
+        # so display-converted sprites are picked up
+        self._sprite = (_sprites.PLAYER_PROJECTILE_SURF if owner_type == EntityType.PLAYER
+                        else _sprites.AI_PROJECTILE_SURF)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate empty columns with the given capacity."""
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.vx = np.empty(capacity, dtype=np.float32)
+        self.vy = np.empty(capacity, dtype=np.float32)
+        self.lifetime = np.empty(capacity, dtype=np.float32)
+        self._tmp = np.empty(capacity, dtype=np.float32)
+        self._keep = np.empty(capacity, dtype=np.bool_)
+
+    def _grow(self) -> None:
+        """Double the pool capacity, keeping live projectiles."""
+        n = self.active_count
+        old = (self.x, self.y, self.vx, self.vy, self.lifetime)
+        self.capacity *= 2
+        self._allocate(self.capacity)
+        new = (self.x, self.y, self.vx, self.vy, self.lifetime)
+        for src, dst in zip(old, new):
+            dst[:n] = src[:n]
+
+    def __len__(self) -> int:
+        return self.active_count
+
+    def clear(self) -> None:
+        """Remove all projectiles."""
+        self.active_count = 0
+
+    def spawn(self, x: float, y: float, direction_x: float, direction_y: float) -> None:
+        """Spawn a projectile at (x, y) travelling along the given direction."""
+        if self.active_count == self.capacity:
+            self._grow()
+        i = self.active_count
+        self.active_count += 1
+
+        # Normalize direction and apply speed
+        magnitude = hypot(direction_x, direction_y)
+        if magnitude > 0:
+            scale = PROJECTILE_SPEED / magnitude
+            self.vx[i] = direction_x * scale
+            self.vy[i] = direction_y * scale
+        else:
+            self.vx[i] = 0.0
+            self.vy[i] = 0.0
+
+        self.x[i] = x
+        self.y[i] = y
+        self.lifetime[i] = PROJECTILE_LIFETIME
+
+    def update(self, dt: float) -> None:
+        """Advance all projectiles and cull expired or off-screen ones."""
+        n = self.active_count
+        if n == 0:
+            return
+        keep = self._keep[:n]
+        alive = step_projectiles(self.x[:n], self.y[:n], self.vx[:n], self.vy[:n],
+                                 self.lifetime[:n], keep, self._tmp[:n],
+                                 dt, self._sw, self._sh, self.width, self.height)
+        if alive != n:
+            self._compact(keep)
+
+    def bounds(self) -> Optional[pygame.Rect]:
+        """
+        Return a rect enclosing every live projectile, or None if empty.
+        The returned rect is reused by the next call.
+        """
+        n = self.active_count
+        if n == 0:
+            return None
+        left = int(np.floor(self.x[:n].min()))
+        top = int(np.floor(self.y[:n].min()))
+        right = int(np.ceil(self.x[:n].max())) + self.width
+        bottom = int(np.ceil(self.y[:n].max())) + self.height
+        self._bounds_rect.update(left, top, right - left, bottom - top)
+        return self._bounds_rect
+
+    def collide(self, rect: pygame.Rect) -> int:
+        """Remove projectiles that overlap rect. Returns the number of hits."""
+        n = self.active_count
+        if n == 0:
+            return 0
+        hit = self._keep[:n]
+        hits = collide_projectiles(self.x[:n], self.y[:n], hit, rect.left, rect.top,
+                                   rect.right, rect.bottom, self.width, self.height)
+        if hits:
+            np.logical_not(hit, out=hit)
+            self._compact(hit)
+        return hits
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Move the projectiles selected by keep to the front of each column."""
+        count = int(np.count_nonzero(keep))
+        if count == self.active_count:
+            return
+        n = self.active_count
+        for column in (self.x, self.y, self.vx, self.vy, self.lifetime):
+            column[:count] = column[:n][keep]
+        self.active_count = count
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw every live projectile with a single batched blit."""
+        n = self.active_count
+        if n == 0:
+            return
+        radius = self.radius
+        sprite = self._sprite
+        # Destinations computed in one pass; truncation matches int()
+        left = ((self.x[:n] + radius).astype(np.int32) - radius).tolist()
+        top = ((self.y[:n] + radius).astype(np.int32) - radius).tolist()
+        screen.blits([(sprite, pos) for pos in zip(left, top)], doreturn=False)
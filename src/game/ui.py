@@ -4,16 +4,25 @@ Implements retro pixel-style interface inspired by the HTML mockup.
 """
 
 import pygame
-from typing import Callable, Optional, List, Tuple
-from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, Optional, List, Tuple
+from enum import IntEnum
 
 from .constants import *
 
 
-class ButtonState(Enum):
-    NORMAL = "normal"
-    HOVER = "hover"
-    PRESSED = "pressed"
+class ButtonState(IntEnum):
+    NORMAL = 0
+    HOVER = 1
+    PRESSED = 2
+
+
+# (button offset, shadow offset) per state; the button sinks onto its shadow
+_BUTTON_STATE_OFFSETS = {
+    ButtonState.NORMAL: (0, SHADOW_OFFSET),
+    ButtonState.HOVER: (2, 2),
+    ButtonState.PRESSED: (4, 0),
+}
 
 
 class PixelButton:
@@ -25,13 +34,40 @@ class PixelButton:
                  color: Tuple[int, int, int], font: pygame.font.Font,
                  callback: Optional[Callable] = None):
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
+        self._shadow_rect = pygame.Rect(x, y, width, height)  # Moved per state in draw()
         self.color = color
         self.font = font
+        self.text = text  # Also sets draw_area, which depends on the label
         self.callback = callback
         self.state = ButtonState.NORMAL
         self.enabled = True
         
+    @property
+    def text(self) -> str:
+        """Button label."""
+        return self._text
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        """Set the label, drop the pre-rendered button artwork and resize draw_area."""
+        self._text = value
+        self._body: Optional[pygame.Surface] = None
+        # Artwork extent relative to the button's top-left; shared by
+        # _render_body() and draw_area so the two always agree
+        self._body_area = self._artwork_area()
+        
+        # Screen area touched by draw() in any state: the artwork, which
+        # includes a label overhanging the button, shifted by every state offset
+        area = self._body_area.move(self.rect.topleft)
+        self.draw_area = area.union(area.move(SHADOW_OFFSET, SHADOW_OFFSET))
+        
+    def _artwork_area(self) -> pygame.Rect:
+        """Button rect plus the centered label and its shadow, relative to the button."""
+        button_rect = pygame.Rect((0, 0), self.rect.size)
+        text_rect = pygame.Rect((0, 0), self.font.size(self.text))
+        text_rect.center = button_rect.center
+        return button_rect.union(text_rect).union(text_rect.move(2, 2))
+        
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse and keyboard events. Returns True if button was clicked."""
         if not self.enabled:
@@ -62,60 +98,44 @@ class PixelButton:
                     
         return False
     
+    def _render_body(self) -> pygame.Surface:
+        """
+        Render background, border and shadowed label once; identical in every state.
+        The surface spans _body_area, which is offset from the button's top-left
+        when a label wider than the button overhangs its edges.
+        """
+        area = self._body_area
+        body = pygame.Surface(area.size, pygame.SRCALPHA)
+        button_rect = pygame.Rect((-area.x, -area.y), self.rect.size)
+        pygame.draw.rect(body, self.color, button_rect)
+        pygame.draw.rect(body, BLACK, button_rect, BUTTON_BORDER)
+        
+        text_surface = self.font.render(self.text, False, WHITE)
+        text_rect = text_surface.get_rect(center=button_rect.center)
+        body.blit(self.font.render(self.text, False, BLACK), text_rect.move(2, 2))
+        body.blit(text_surface, text_rect)
+        return body.convert_alpha()
+    
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button with pixel-perfect shadow effects."""
         if not self.enabled:
             return
             
-        # Calculate offset based on state (matching HTML behavior)
-        offset_x = 0
-        offset_y = 0
-        shadow_offset = SHADOW_OFFSET
+        # Offset based on state (matching HTML behavior)
+        offset, shadow_offset = _BUTTON_STATE_OFFSETS[self.state]
+        x, y = self.rect.topleft
         
-        if self.state == ButtonState.HOVER:
-            offset_x = 2
-            offset_y = 2
-            shadow_offset = 2
-        elif self.state == ButtonState.PRESSED:
-            offset_x = 4
-            offset_y = 4
-            shadow_offset = 0
-            
         # Draw shadow
         if shadow_offset > 0:
-            shadow_rect = pygame.Rect(
-                self.rect.x + shadow_offset,
-                self.rect.y + shadow_offset,
-                self.rect.width,
-                self.rect.height
-            )
+            shadow_rect = self._shadow_rect
+            shadow_rect.topleft = (x + shadow_offset, y + shadow_offset)
             pygame.draw.rect(screen, BLACK, shadow_rect)
             
-        # Draw button background
-        button_rect = pygame.Rect(
-            self.rect.x + offset_x,
-            self.rect.y + offset_y,
-            self.rect.width,
-            self.rect.height
-        )
-        pygame.draw.rect(screen, self.color, button_rect)
-        
-        # Draw border
-        pygame.draw.rect(screen, BLACK, button_rect, BUTTON_BORDER)
-        
-        # Draw text with shadow
-        text_surface = self.font.render(self.text, False, WHITE)
-        text_rect = text_surface.get_rect(center=button_rect.center)
-        
-        # Text shadow
-        shadow_text_rect = text_rect.copy()
-        shadow_text_rect.x += 2
-        shadow_text_rect.y += 2
-        shadow_text_surface = self.font.render(self.text, False, BLACK)
-        screen.blit(shadow_text_surface, shadow_text_rect)
-        
-        # Main text
-        screen.blit(text_surface, text_rect)
+        # Button artwork, rendered once per label
+        if self._body is None:
+            self._body = self._render_body()
+        body_x, body_y = self._body_area.topleft
+        screen.blit(self._body, (x + offset + body_x, y + offset + body_y))
 
 
 class Menu:
@@ -124,14 +144,25 @@ class Menu:
     def __init__(self, font: pygame.font.Font):
         self.font = font
         self.buttons: List[PixelButton] = []
+        self.button_rects: List[pygame.Rect] = []
+        # Areas of buttons whose state changed since the last draw
+        self.dirty_rects: List[pygame.Rect] = []
         self.selected_index = 0
+        # True once a motion outside every button has reset hover states;
+        # further motions outside can then be skipped
+        self._pointer_idle = False
         
     def add_button(self, button: PixelButton) -> None:
         """Add a button to the menu."""
         self.buttons.append(button)
+        self.button_rects.append(button.rect)
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle events for all buttons and keyboard navigation."""
+        if event.type != pygame.MOUSEMOTION:
+            # Any other event may change button states
+            self._pointer_idle = False
+            
         # Handle keyboard navigation
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
@@ -145,27 +176,37 @@ class Menu:
                     self.buttons[self.selected_index].callback()
                 return True
                 
+        # Skip mouse motion that cannot change any button state
+        if event.type == pygame.MOUSEMOTION:
+            outside = pygame.Rect(event.pos, (1, 1)).collidelist(self.button_rects) == -1
+            if outside and self._pointer_idle:
+                return False
+            self._pointer_idle = outside
+            
         # Handle mouse events
         for i, button in enumerate(self.buttons):
-            if button.handle_event(event):
+            previous_state = button.state
+            clicked = button.handle_event(event)
+            if button.state != previous_state:
+                self.dirty_rects.append(button.draw_area)
+            if clicked:
                 self.selected_index = i
                 return True
                 
         return False
     
-    def update_selection(self) -> None:
+    def update_selection(self, mouse_pos: Tuple[int, int]) -> None:
         """Update button states based on keyboard selection."""
-        for i, button in enumerate(self.buttons):
-            if i == self.selected_index:
-                # Keyboard selection takes precedence over mouse hover
-                mouse_pos = pygame.mouse.get_pos()
-                if not button.rect.collidepoint(mouse_pos):
-                    button.state = ButtonState.HOVER
-            # Mouse hover is handled in button.handle_event()
+        # Keyboard selection takes precedence over mouse hover;
+        # mouse hover is handled in button.handle_event()
+        if 0 <= self.selected_index < len(self.buttons):
+            button = self.buttons[self.selected_index]
+            if not button.rect.collidepoint(mouse_pos):
+                button.state = ButtonState.HOVER
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw all buttons."""
-        self.update_selection()
+    def draw(self, screen: pygame.Surface, mouse_pos: Tuple[int, int]) -> None:
+        """Draw all buttons. mouse_pos is the pointer position sampled this frame."""
+        self.update_selection(mouse_pos)
         for button in self.buttons:
             button.draw(screen)
 
@@ -177,27 +218,28 @@ class HealthBar:
         self.rect = pygame.Rect(x, y, width, height)
         self.max_health = max_health
         self.current_health = max_health
+        # Rendered bar, rebuilt only when the health value changes
+        self._surface = pygame.Surface(self.rect.size).convert()
+        self._drawn_health: Optional[int] = None
         
     def set_health(self, health: int) -> None:
         """Set current health value."""
         self.current_health = max(0, min(health, self.max_health))
         
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the health bar."""
+    def _render(self) -> None:
+        """Redraw the cached bar surface for the current health."""
+        surface = self._surface
+        bar_rect = surface.get_rect()
+        
         # Background
-        pygame.draw.rect(screen, BLACK, self.rect)
-        pygame.draw.rect(screen, WHITE, self.rect, 2)
+        pygame.draw.rect(surface, BLACK, bar_rect)
+        pygame.draw.rect(surface, WHITE, bar_rect, 2)
         
         # Health fill
         if self.current_health > 0:
             health_ratio = self.current_health / self.max_health
-            fill_width = int((self.rect.width - 4) * health_ratio)
-            fill_rect = pygame.Rect(
-                self.rect.x + 2,
-                self.rect.y + 2,
-                fill_width,
-                self.rect.height - 4
-            )
+            fill_width = int((bar_rect.width - 4) * health_ratio)
+            fill_rect = pygame.Rect(2, 2, fill_width, bar_rect.height - 4)
             
             # Color based on health level
             if health_ratio > 0.6:
@@ -207,7 +249,14 @@ class HealthBar:
             else:
                 color = (255, 0, 0)  # Red
                 
-            pygame.draw.rect(screen, color, fill_rect)
+            pygame.draw.rect(surface, color, fill_rect)
+        self._drawn_health = self.current_health
+        
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the health bar."""
+        if self.current_health != self._drawn_health:
+            self._render()
+        screen.blit(self._surface, self.rect)
 
 
 def load_font(size: int) -> pygame.font.Font:
@@ -224,16 +273,41 @@ def load_font(size: int) -> pygame.font.Font:
         return pygame.font.Font(None, size * 2)  # System font needs larger size
 
 
+@lru_cache(maxsize=128)
+def render_text_cached(font: pygame.font.Font, text: str,
+                       color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render text once per (font, text, color) and reuse the surface."""
+    return font.render(text, False, color).convert_alpha()
+
+
+# Pre-composited shadowed text keyed by (text, font, color, shadow_color, shadow_offset)
+_shadow_text_cache: Dict[Tuple, pygame.Surface] = {}
+
+
+def _render_shadowed(text: str, font: pygame.font.Font, color: Tuple[int, int, int],
+                     shadow_color: Tuple[int, int, int],
+                     shadow_offset: Tuple[int, int]) -> pygame.Surface:
+    """Composite text over its shadow into a single transparent surface."""
+    dx, dy = shadow_offset
+    text_surface = font.render(text, False, color)
+    width, height = text_surface.get_size()
+    composite = pygame.Surface((width + abs(dx), height + abs(dy)), pygame.SRCALPHA)
+    composite.blit(font.render(text, False, shadow_color), (max(dx, 0), max(dy, 0)))
+    composite.blit(text_surface, (max(-dx, 0), max(-dy, 0)))
+    return composite.convert_alpha()
+
+
 def draw_text_with_shadow(surface: pygame.Surface, text: str, font: pygame.font.Font,
                          pos: Tuple[int, int], color: Tuple[int, int, int] = WHITE,
                          shadow_color: Tuple[int, int, int] = BLACK,
                          shadow_offset: Tuple[int, int] = (2, 2)) -> None:
     """Draw text with a shadow effect."""
-    # Draw shadow
-    shadow_surface = font.render(text, False, shadow_color)
-    shadow_pos = (pos[0] + shadow_offset[0], pos[1] + shadow_offset[1])
-    surface.blit(shadow_surface, shadow_pos)
-    
-    # Draw main text
-    text_surface = font.render(text, False, color)
-    surface.blit(text_surface, pos)
\ No newline at end of file
+    key = (text, font, color, shadow_color, shadow_offset)
+    composite = _shadow_text_cache.get(key)
+    if composite is None:
+        composite = _shadow_text_cache[key] = _render_shadowed(
+            text, font, color, shadow_color, shadow_offset)
+        
+    # Text sits at pos; shift left/up when the shadow extends that way
+    surface.blit(composite, (pos[0] - max(-shadow_offset[0], 0),
+                             pos[1] - max(-shadow_offset[1], 0)))